@@ -194,7 +194,9 @@ class AudioPlayer:
         self._compute_client_time = compute_client_time
         self._compute_server_time = compute_server_time
         self._format: PCMFormat | None = None
-        self._queue: asyncio.Queue[_QueuedChunk] = asyncio.Queue()
+        # Plain deque: it is filled on the event loop and drained by the audio thread,
+        # and append/popleft are atomic without asyncio.Queue's waiter bookkeeping
+        self._queue: collections.deque[_QueuedChunk] = collections.deque()
         self._stream: sounddevice.RawOutputStream | None = None
         self._closed = False
         self._stream_started = False
@@ -295,6 +297,22 @@ class AudioPlayer:
             device,
         )
 
+    def set_time_sync(
+        self,
+        compute_client_time: Callable[[int], int],
+        compute_server_time: Callable[[int], int],
+    ) -> None:
+        """Replace the time conversion functions, e.g. after switching clients.
+
+        Args:
+            compute_client_time: Function that converts server timestamps to client
+                timestamps (monotonic loop time).
+            compute_server_time: Function that converts client timestamps (monotonic
+                loop time) to server timestamps.
+        """
+        self._compute_client_time = compute_client_time
+        self._compute_server_time = compute_server_time
+
     @property
     def volume(self) -> int:
         """Get the current volume level (0-100)."""
@@ -338,11 +356,7 @@ class AudioPlayer:
         self._stream_started = False
 
         # Drain all queued chunks
-        while True:
-            try:
-                self._queue.get_nowait()
-            except asyncio.QueueEmpty:
-                break
+        self._queue.clear()
         # Reset playback state
         self._playback_state = PlaybackState.INITIALIZING
         self._first_real_chunk = True
@@ -580,7 +594,7 @@ class AudioPlayer:
 
         Updates server timestamp cursor if needed.
         """
-        self._current_chunk = self._queue.get_nowait()
+        self._current_chunk = self._queue.popleft()
         self._current_chunk_offset = 0
         # Initialize server cursor if needed
         if self._server_ts_cursor_us == 0:
@@ -599,7 +613,7 @@ class AudioPlayer:
 
         # Ensure we have a current chunk
         if self._current_chunk is None:
-            if self._queue.empty():
+            if not self._queue:
                 return None
             self._initialize_current_chunk()
 
@@ -646,7 +660,7 @@ class AudioPlayer:
         while bytes_written < total_bytes_needed:
             # Get frames from current chunk
             if self._current_chunk is None:
-                if self._queue.empty():
+                if not self._queue:
                     # No more data - pad with silence
                     silence_bytes = total_bytes_needed - bytes_written
                     result[bytes_written:] = b"\x00" * silence_bytes
@@ -711,9 +725,9 @@ class AudioPlayer:
         frame_size = self._format.frame_size
         while frames_to_skip > 0:
             if self._current_chunk is None:
-                if self._queue.empty():
+                if not self._queue:
                     break
-                self._current_chunk = self._queue.get_nowait()
+                self._current_chunk = self._queue.popleft()
                 self._current_chunk_offset = 0
                 if self._server_ts_cursor_us == 0:
                     self._server_ts_cursor_us = self._current_chunk.server_timestamp_us
@@ -1114,7 +1128,7 @@ class AudioPlayer:
             gap_frames = (gap_us * self._format.sample_rate) // 1_000_000
             silence_bytes = gap_frames * self._format.frame_size
             silence = b"\x00" * silence_bytes
-            self._queue.put_nowait(
+            self._queue.append(
                 _QueuedChunk(
                     server_timestamp_us=self._expected_next_timestamp,
                     audio_data=silence,
@@ -1159,19 +1173,19 @@ class AudioPlayer:
                 server_timestamp_us=server_timestamp_us,
                 audio_data=payload,
             )
-            self._queue.put_nowait(chunk)
+            self._queue.append(chunk)
             # Track duration of queued audio
             self._queued_duration_us += chunk_duration_us
             # Update expected position for next chunk
             self._expected_next_timestamp = server_timestamp_us + chunk_duration_us
 
         # Start stream immediately when first chunk arrives
-        if not self._stream_started and self._queue.qsize() > 0 and self._stream is not None:
+        if not self._stream_started and self._queue and self._stream is not None:
             self._stream.start()
             self._stream_started = True
             logger.info(
                 "Stream STARTED: %d chunks, %.2f seconds buffered",
-                self._queue.qsize(),
+                len(self._queue),
                 self._queued_duration_us / 1_000_000,
             )
 
@@ -47,6 +47,7 @@ class AudioStreamHandler:
         self._muted = muted
         self._on_event = on_event
         self._client: SendspinClient | None = None
+        self._unsubscribers: list[Callable[[], None]] = []
         self.audio_player: AudioPlayer | None = None
         self._current_format: AudioFormat | None = None
         self._stream_active = False  # Track if stream is currently active
@@ -68,21 +69,54 @@ class AudioStreamHandler:
     def attach_client(self, client: SendspinClient) -> list[Callable[[], None]]:
         """Attach to a SendspinClient and register listeners.
 
+        Attaching the client that is already attached is a no-op. Attaching a
+        different client detaches the previous one first; an existing audio
+        player is kept and rebound to the new client's time synchronization.
+
         Args:
             client: The Sendspin client to attach to.
 
         Returns:
             List of unsubscribe functions for all registered listeners.
         """
+        if client is self._client:
+            return list(self._unsubscribers)
+        if self._client is not None:
+            self.detach_client()
+
         self._client = client
+        if self.audio_player is not None:
+            self.audio_player.set_time_sync(client.compute_play_time, client.compute_server_time)
 
         # Register listeners directly with the client
-        return [
+        self._unsubscribers = [
             client.add_audio_chunk_listener(self._on_audio_chunk),
             client.add_stream_start_listener(self._on_stream_start),
             client.add_stream_end_listener(self._on_stream_end),
             client.add_stream_clear_listener(self._on_stream_clear),
         ]
+        return list(self._unsubscribers)
+
+    def detach_client(self) -> None:
+        """Detach from the current client while keeping the audio output open.
+
+        Unregisters all client listeners and drops queued audio, but keeps the
+        audio player and its output stream so a later attach_client() can
+        resume playback without reopening the audio device.
+        """
+        for unsubscribe in self._unsubscribers:
+            unsubscribe()
+        self._unsubscribers = []
+        self._client = None
+
+        # Fire stop event if stream was active
+        if self._stream_active:
+            self._stream_active = False
+            if self._on_event:
+                self._on_event("stop")
+
+        if self.audio_player is not None:
+            self.audio_player.clear()
 
     def _on_audio_chunk(
         self, server_timestamp_us: int, audio_data: bytes, fmt: AudioFormat
@@ -90,20 +124,20 @@ class AudioStreamHandler:
         """Handle incoming audio chunks."""
         assert self._client is not None, "Received audio chunk but client is not attached"
 
-        # Initialize or reconfigure audio player if format changed
-        if self.audio_player is None or self._current_format != fmt:
-            if self.audio_player is not None:
-                self.audio_player.clear()
-
+        # Initialize audio player on first use
+        if self.audio_player is None:
             loop = asyncio.get_running_loop()
             self.audio_player = AudioPlayer(
                 loop, self._client.compute_play_time, self._client.compute_server_time
             )
+            self.audio_player.set_volume(self._volume, muted=self._muted)
+
+        # Only reopen the output stream when the format actually changes
+        if self._current_format != fmt:
+            self.audio_player.clear()
             self.audio_player.set_format(fmt, device=self._audio_device)
             self._current_format = fmt
 
-            self.audio_player.set_volume(self._volume, muted=self._muted)
-
         # Submit audio chunk - AudioPlayer handles timing
         self.audio_player.submit(server_timestamp_us, audio_data)
 
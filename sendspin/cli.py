@@ -8,7 +8,7 @@ import logging
 import socket
 import sys
 import traceback
-from collections.abc import Sequence
+from collections.abc import Callable, Sequence
 from importlib.metadata import version
 from typing import TYPE_CHECKING
 
@@ -364,6 +364,16 @@ def _resolve_client_info(client_id: str | None, client_name: str | None) -> tupl
     )
 
 
+def _get_loop_factory() -> Callable[[], asyncio.AbstractEventLoop] | None:
+    """Return uvloop's event loop factory if installed, else None for the default loop."""
+    try:
+        import uvloop
+    except ImportError:
+        return None
+    factory: Callable[[], asyncio.AbstractEventLoop] = uvloop.new_event_loop
+    return factory
+
+
 async def _run_serve_mode(args: argparse.Namespace) -> int:
     """Run the server mode."""
     from sendspin.serve import ServeConfig, run_server
@@ -435,7 +445,7 @@ def main() -> int:
     # Handle serve subcommand
     if args.command == "serve":
         try:
-            return asyncio.run(_run_serve_mode(args))
+            return asyncio.run(_run_serve_mode(args), loop_factory=_get_loop_factory())
         except KeyboardInterrupt:
             return 0
         except Exception as e:
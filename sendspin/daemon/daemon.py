@@ -15,10 +15,8 @@ from aiosendspin.models.core import (
     ClientGoodbyePayload,
     ServerCommandPayload,
 )
-from aiosendspin.models.player import ClientHelloPlayerSupport, SupportedAudioFormat
 from aiosendspin_mpris import MPRIS_AVAILABLE, SendspinMpris
 from aiosendspin.models.types import (
-    AudioCodec,
     GoodbyeReason,
     PlayerCommand,
     PlayerStateType,
@@ -29,10 +27,13 @@ from sendspin.audio import AudioDevice
 from sendspin.audio_connector import AudioStreamHandler
 from sendspin.hooks import run_hook
 from sendspin.settings import ClientSettings
-from sendspin.utils import create_task, get_device_info
+from sendspin.utils import create_task, get_device_info, get_player_support
 
 logger = logging.getLogger(__name__)
 
+# Reconnect delays in seconds: exponential backoff capped at 5 minutes
+_BACKOFF_SCHEDULE: tuple[float, ...] = (1, 2, 4, 8, 16, 32, 64, 128, 256, 300)
+
 
 @dataclass
 class DaemonArgs:
@@ -81,18 +82,7 @@ class SendspinDaemon:
             client_name=self._args.client_name,
             roles=client_roles,
             device_info=get_device_info(),
-            player_support=ClientHelloPlayerSupport(
-                supported_formats=[
-                    SupportedAudioFormat(
-                        codec=AudioCodec.PCM, channels=2, sample_rate=44_100, bit_depth=16
-                    ),
-                    SupportedAudioFormat(
-                        codec=AudioCodec.PCM, channels=1, sample_rate=44_100, bit_depth=16
-                    ),
-                ],
-                buffer_capacity=32_000_000,
-                supported_commands=[PlayerCommand.VOLUME, PlayerCommand.MUTE],
-            ),
+            player_support=get_player_support(),
             static_delay_ms=static_delay_ms,
         )
 
@@ -140,15 +130,30 @@ class SendspinDaemon:
         except asyncio.CancelledError:
             logger.debug("Daemon cancelled")
         finally:
-            await self._stop_mpris_and_audio()
+            # Teardown order matters: audio stops before the client goes away, and the
+            # client says goodbye before the listener closes its websocket. A failing
+            # step is logged so the remaining ones still run.
+            try:
+                await self._stop_mpris_and_audio()
+            except Exception:
+                logger.exception("Error stopping audio")
             if self._client is not None:
-                await self._client.disconnect()
+                try:
+                    await self._client.disconnect()
+                except Exception:
+                    logger.exception("Error disconnecting client")
                 self._client = None
             if self._listener is not None:
-                await self._listener.stop()
+                try:
+                    await self._listener.stop()
+                except Exception:
+                    logger.exception("Error stopping listener")
                 self._listener = None
             if self._settings:
-                await self._settings.flush()
+                try:
+                    await self._settings.flush()
+                except Exception:
+                    logger.exception("Error saving settings")
             logger.info("Daemon stopped")
 
         return 0
@@ -161,7 +166,6 @@ class SendspinDaemon:
         if MPRIS_AVAILABLE and self._args.use_mpris:
             self._mpris = SendspinMpris(self._client)
             self._mpris.start()
-        self._audio_handler.attach_client(self._client)
         self._server_url = self._args.url
         self._client.add_server_command_listener(self._handle_server_command)
         await self._connection_loop(self._args.url)
@@ -183,18 +187,27 @@ class SendspinDaemon:
         )
         await self._listener.start()
 
-        # Keep running until cancelled
-        while True:
-            await asyncio.sleep(3600)
+        # Keep running until cancelled; a bare future never resolves on its own
+        await asyncio.get_running_loop().create_future()
 
-    async def _stop_mpris_and_audio(self) -> None:
-        """Stop MPRIS and cleanup audio handler."""
+    def _stop_mpris(self) -> None:
+        """Stop MPRIS if it is running."""
         if self._mpris is not None:
             self._mpris.stop()
             self._mpris = None
+
+    async def _stop_mpris_and_audio(self) -> None:
+        """Stop MPRIS and cleanup audio handler."""
+        self._stop_mpris()
         if self._audio_handler is not None:
             await self._audio_handler.cleanup()
 
+    def _release_connection(self) -> None:
+        """Stop MPRIS and detach the audio handler, keeping the audio output open."""
+        self._stop_mpris()
+        if self._audio_handler is not None:
+            self._audio_handler.detach_client()
+
     async def _handle_server_connection(self, ws: web.WebSocketResponse) -> None:
         """Handle an incoming server connection."""
         logger.info("Server connected")
@@ -207,7 +220,7 @@ class SendspinDaemon:
             # Clean up any previous client
             if self._client is not None:
                 logger.info("Disconnecting from previous server")
-                await self._stop_mpris_and_audio()
+                self._release_connection()
                 if self._client.connected:
                     try:
                         await self._client._send_message(  # noqa: SLF001
@@ -232,13 +245,13 @@ class SendspinDaemon:
                 await client.attach_websocket(ws)
             except TimeoutError:
                 logger.warning("Handshake with server timed out")
-                await self._stop_mpris_and_audio()
+                self._release_connection()
                 if self._client is client:
                     self._client = None
                 return
             except Exception:
                 logger.exception("Error during server handshake")
-                await self._stop_mpris_and_audio()
+                self._release_connection()
                 if self._client is client:
                     self._client = None
                 return
@@ -256,45 +269,53 @@ class SendspinDaemon:
         finally:
             # Only cleanup if we're still the active client (not replaced by new connection)
             if self._client is client:
-                await self._stop_mpris_and_audio()
+                self._release_connection()
 
     async def _connection_loop(self, url: str) -> None:
         """Run the connection loop with automatic reconnection (client-initiated mode)."""
         assert self._client is not None
         assert self._audio_handler is not None
-        error_backoff = 1.0
-        max_backoff = 300.0
-
-        while True:
-            try:
-                await self._client.connect(url)
-                error_backoff = 1.0
-
-                # Wait for disconnect
-                disconnect_event: asyncio.Event = asyncio.Event()
-                unsubscribe = self._client.add_disconnect_listener(disconnect_event.set)
-                await disconnect_event.wait()
-                unsubscribe()
-
-                # Connection dropped
-                logger.info("Disconnected from server")
-                await self._audio_handler.cleanup()
+        backoff_idx = 0
 
-                logger.info("Reconnecting to %s", url)
+        # A single event and listener serve every reconnect; the event is
+        # cleared before each attempt
+        disconnect_event = asyncio.Event()
+        unsubscribe = self._client.add_disconnect_listener(disconnect_event.set)
 
-            except (TimeoutError, OSError, ClientError) as e:
-                logger.warning(
-                    "Connection error (%s), retrying in %.0fs",
-                    type(e).__name__,
-                    error_backoff,
-                )
-
-                await asyncio.sleep(error_backoff)
-                error_backoff = min(error_backoff * 2, max_backoff)
-
-            except Exception:
-                logger.exception("Unexpected error during connection")
-                break
+        try:
+            while True:
+                try:
+                    # No-op while attached; re-attaches after a previous disconnect
+                    self._audio_handler.attach_client(self._client)
+                    disconnect_event.clear()
+                    await self._client.connect(url)
+                    backoff_idx = 0
+
+                    # Wait for disconnect
+                    await disconnect_event.wait()
+
+                    # Connection dropped
+                    logger.info("Disconnected from server")
+                    self._audio_handler.detach_client()
+
+                    logger.info("Reconnecting to %s", url)
+
+                except (TimeoutError, OSError, ClientError) as e:
+                    error_backoff = _BACKOFF_SCHEDULE[backoff_idx]
+                    logger.warning(
+                        "Connection error (%s), retrying in %.0fs",
+                        type(e).__name__,
+                        error_backoff,
+                    )
+
+                    await asyncio.sleep(error_backoff)
+                    backoff_idx = min(backoff_idx + 1, len(_BACKOFF_SCHEDULE) - 1)
+
+                except Exception:
+                    logger.exception("Unexpected error during connection")
+                    break
+        finally:
+            unsubscribe()
 
     def _handle_server_command(self, payload: ServerCommandPayload) -> None:
         """Handle server commands for player volume/mute control and save to settings."""
@@ -58,6 +58,10 @@ SERVER_SERVICE_TYPE = "_sendspin-server._tcp.local."
 CLIENT_SERVICE_TYPE = "_sendspin._tcp.local."
 DEFAULT_PATH = "/sendspin"
 
+# Suffixes stripped from mDNS instance names to get the friendly name
+_SERVER_NAME_SUFFIX = f".{SERVER_SERVICE_TYPE}"
+_CLIENT_NAME_SUFFIX = f".{CLIENT_SERVICE_TYPE}"
+
 
 def _build_service_url(host: str, port: int, properties: dict[bytes, bytes | None]) -> str:
     """Construct WebSocket URL from mDNS service info."""
@@ -78,12 +82,21 @@ class _ServiceDiscoveryListener:
         self._loop = loop
         self._next_result: asyncio.Future[DiscoveredServer] | None = None
         self._servers: dict[str, DiscoveredServer] = {}
+        # Cached tuple of servers, reset whenever the servers change
+        self._snapshot: tuple[DiscoveredServer, ...] | None = None
 
     @property
     def servers(self) -> dict[str, DiscoveredServer]:
         """Get all discovered servers."""
         return self._servers
 
+    @property
+    def snapshot(self) -> tuple[DiscoveredServer, ...]:
+        """Get an immutable snapshot of all discovered servers."""
+        if self._snapshot is None:
+            self._snapshot = tuple(self._servers.values())
+        return self._snapshot
+
     async def wait_for_next(self) -> DiscoveredServer:
         """Wait for the first server to be discovered."""
         if self._next_result is None:
@@ -105,11 +118,12 @@ class _ServiceDiscoveryListener:
 
         # Track this server
         self._servers[name] = DiscoveredServer(
-            name=name.removesuffix(f".{SERVER_SERVICE_TYPE}"),
+            name=name.removesuffix(_SERVER_NAME_SUFFIX),
             url=url,
             host=host,
             port=info.port,
         )
+        self._snapshot = None
 
         # Signal first server discovery
         if self._next_result and not self._next_result.done():
@@ -124,7 +138,8 @@ class _ServiceDiscoveryListener:
 
     def remove_service(self, _zeroconf: AsyncZeroconf, _service_type: str, name: str) -> None:
         """Handle service removal (server offline)."""
-        self._servers.pop(name, None)
+        if self._servers.pop(name, None) is not None:
+            self._snapshot = None
 
 
 class ServiceDiscovery:
@@ -164,11 +179,14 @@ class ServiceDiscovery:
             return servers[0]
         return await self._listener.wait_for_next()
 
-    def get_servers(self) -> list[DiscoveredServer]:
-        """Get all discovered servers."""
+    def get_servers(self) -> tuple[DiscoveredServer, ...]:
+        """Get all discovered servers.
+
+        The returned tuple is shared between callers until the set of servers changes.
+        """
         if self._listener is None:
-            return []
-        return list(self._listener.servers.values())
+            return ()
+        return self._listener.snapshot
 
     async def stop(self) -> None:
         """Stop discovery and clean up resources."""
@@ -194,7 +212,7 @@ async def discover_servers(discovery_time: float = 3.0) -> list[DiscoveredServer
     await discovery.start()
     try:
         await asyncio.sleep(discovery_time)
-        return discovery.get_servers()
+        return list(discovery.get_servers())
     finally:
         await discovery.stop()
 
@@ -226,7 +244,7 @@ class _ClientDiscoveryListener:
 
         # Track this client
         self._clients[name] = DiscoveredClient(
-            name=name.removesuffix(f".{CLIENT_SERVICE_TYPE}"),
+            name=name.removesuffix(_CLIENT_NAME_SUFFIX),
             url=url,
             host=host,
             port=info.port,
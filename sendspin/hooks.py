@@ -30,28 +30,29 @@ async def run_hook(
         client_id: Client identifier.
         client_name: Client friendly name.
     """
-    # Build environment with SENDSPIN_ prefixed variables
+    # Build environment with SENDSPIN_ prefixed variables, skipping unset values
+    optional_vars = (
+        ("SENDSPIN_SERVER_ID", server_id),
+        ("SENDSPIN_SERVER_NAME", server_name),
+        ("SENDSPIN_SERVER_URL", server_url),
+        ("SENDSPIN_CLIENT_ID", client_id),
+        ("SENDSPIN_CLIENT_NAME", client_name),
+    )
     env = os.environ.copy()
     env["SENDSPIN_EVENT"] = event
-    if server_id:
-        env["SENDSPIN_SERVER_ID"] = server_id
-    if server_name:
-        env["SENDSPIN_SERVER_NAME"] = server_name
-    if server_url:
-        env["SENDSPIN_SERVER_URL"] = server_url
-    if client_id:
-        env["SENDSPIN_CLIENT_ID"] = client_id
-    if client_name:
-        env["SENDSPIN_CLIENT_NAME"] = client_name
+    env.update((key, value) for key, value in optional_vars if value)
 
     logger.debug("Running hook for %s event: %s", event, command)
 
+    # stdout is only ever logged at debug level, so don't pipe it otherwise
+    capture_stdout = logger.isEnabledFor(logging.DEBUG)
+
     try:
         # Use shell=True to allow complex commands like "amixer set Master unmute"
         proc = await asyncio.create_subprocess_shell(
             command,
             env=env,
-            stdout=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE if capture_stdout else asyncio.subprocess.DEVNULL,
             stderr=asyncio.subprocess.PIPE,
         )
         stdout, stderr = await proc.communicate()
@@ -63,7 +64,7 @@ async def run_hook(
                 command,
                 stderr.decode().strip() if stderr else "(empty)",
             )
-        elif stdout or stderr:
+        elif capture_stdout and (stdout or stderr):
             logger.debug(
                 "Hook output: stdout=%s stderr=%s",
                 stdout.decode().strip() if stdout else "(empty)",
@@ -11,6 +11,7 @@ import uuid
 from contextlib import suppress
 from dataclasses import dataclass
 
+import ifaddr
 import qrcode
 from aiosendspin.server import (
     ClientAddedEvent,
@@ -48,14 +49,27 @@ def print_qr_code(url: str) -> None:
 
 
 def get_local_ip() -> str:
-    """Get the local IP address of this machine on the LAN."""
+    """Get the local IP address of this machine on the LAN.
+
+    Asks the kernel which address routes outbound traffic (a UDP connect sends
+    no packets). If that fails, e.g. without a default route on an air-gapped
+    LAN, picks the first IPv4 address that is neither loopback nor link-local.
+    """
     try:
         with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
             s.connect(("8.8.8.8", 80))
             ip: str = s.getsockname()[0]
             return ip
-    except Exception:
-        return "localhost"
+    except OSError:
+        pass
+    for adapter in ifaddr.get_adapters():
+        for adapter_ip in adapter.ips:
+            # IPv6 addresses are reported as tuples, IPv4 addresses as strings
+            if isinstance(adapter_ip.ip, str) and not adapter_ip.ip.startswith(
+                ("127.", "169.254.")
+            ):
+                return adapter_ip.ip
+    return "localhost"
 
 
 @dataclass
@@ -102,10 +102,8 @@ async def connect_to_chromecast(
             browser.stop_discovery()
 
     try:
-        cast = await asyncio.wait_for(
-            loop.run_in_executor(None, _connect),
-            timeout=15.0,
-        )
+        async with asyncio.timeout(15.0):
+            cast = await loop.run_in_executor(None, _connect)
     except TimeoutError as e:
         raise TimeoutError(f"Timeout connecting to Chromecast at {host}") from e
 
@@ -171,7 +169,8 @@ async def _launch_sendspin_app(
 
     await loop.run_in_executor(None, launch)
     try:
-        await asyncio.wait_for(event.wait(), timeout=10.0)
+        async with asyncio.timeout(10.0):
+            await event.wait()
     except TimeoutError as e:
         raise TimeoutError("Timeout waiting for Sendspin Cast App to launch") from e
 
@@ -6,6 +6,10 @@ from pathlib import Path
 from aiohttp import web
 from aiosendspin.server import SendspinServer
 
+# Web assets directory, resolved once at import
+_WEB_PATH = Path(str(files("sendspin.serve.web")))
+_INDEX_PATH = _WEB_PATH / "index.html"
+
 
 class SendspinPlayerServer(SendspinServer):
     """SendspinServer that serves an embedded web player at /."""
@@ -14,16 +18,13 @@ class SendspinPlayerServer(SendspinServer):
         """Create web app with embedded player and static file serving."""
         app = super()._create_web_application()
 
-        # Get path to web assets directory
-        web_path = Path(str(files("sendspin.serve.web")))
-
-        # Serve index.html at root
+        # Serve index.html at root; a FileResponse is single-use, so create one per request
         async def index_handler(request: web.Request) -> web.FileResponse:
-            return web.FileResponse(web_path / "index.html")
+            return web.FileResponse(_INDEX_PATH)
 
         app.router.add_get("/", index_handler)
 
         # Serve other static files (css, js)
-        app.router.add_static("/", web_path)
+        app.router.add_static("/", _WEB_PATH)
 
         return app
@@ -7,19 +7,44 @@ automatically loaded from disk and saved with debouncing.
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import json
 import logging
-from dataclasses import dataclass, field, fields
+import os
+from collections.abc import Callable, Iterable
+from dataclasses import MISSING, dataclass, field, fields
 from pathlib import Path
 from typing import Any, ClassVar, Literal
 
 logger = logging.getLogger(__name__)
 
+try:
+    import orjson
+
+    def _dumps(data: dict[str, Any]) -> bytes:
+        """Serialize settings to indented JSON bytes."""
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2) + b"\n"
+
+    def _loads(data: bytes) -> Any:
+        """Parse JSON bytes."""
+        return orjson.loads(data)
+
+except ImportError:
+
+    def _dumps(data: dict[str, Any]) -> bytes:
+        """Serialize settings to indented JSON bytes."""
+        return (json.dumps(data, indent=2) + "\n").encode()
+
+    def _loads(data: bytes) -> Any:
+        """Parse JSON bytes."""
+        return json.loads(data)
+
+
 # Debounce delay for saving settings
 SAVE_DEBOUNCE_SECONDS = 60.0
 
 
-@dataclass
+@dataclass(slots=True)
 class BaseSettings:
     """Base class for settings with persistence support.
 
@@ -37,22 +62,39 @@ class BaseSettings:
     _debounce_save_handle: asyncio.TimerHandle | None = field(
         default=None, repr=False, compare=False
     )
+    # Last payload submitted for writing, used to skip redundant writes. Only changed
+    # on the event loop; reset to None if a write fails.
+    _last_serialized: bytes | None = field(default=None, repr=False, compare=False)
+    # Executor future of the write currently in flight
+    _save_future: asyncio.Future[bool] | None = field(default=None, repr=False, compare=False)
+    # Event loop the settings are used on, captured by load()
+    _loop: asyncio.AbstractEventLoop | None = field(default=None, repr=False, compare=False)
+    # Loop time at which the debounced save is due
+    _save_deadline: float = field(default=0.0, repr=False, compare=False)
 
     # Fields to exclude from serialization
-    _internal_fields: ClassVar[set[str]] = {"_settings_file", "_debounce_save_handle"}
+    _internal_fields: ClassVar[set[str]] = {
+        "_settings_file",
+        "_debounce_save_handle",
+        "_last_serialized",
+        "_save_future",
+        "_loop",
+        "_save_deadline",
+    }
 
     def to_dict(self) -> dict[str, Any]:
         """Convert settings to a dictionary for serialization."""
         return {
-            f.name: getattr(self, f.name)
-            for f in fields(self)
-            if f.name not in self._internal_fields
+            name: getattr(self, name) for name, _default, _factory in _serialized_fields(type(self))
         }
 
-    def _update_fields(self, updates: dict[str, Any]) -> bool:
-        """Update fields and return whether any changed."""
+    def _update_fields(self, updates: Iterable[tuple[str, Any]]) -> bool:
+        """Update fields from (name, value) pairs, skipping None values.
+
+        Returns whether any field changed.
+        """
         changed = False
-        for field_name, value in updates.items():
+        for field_name, value in updates:
             if value is not None and getattr(self, field_name) != value:
                 setattr(self, field_name, value)
                 changed = True
@@ -60,49 +102,168 @@ class BaseSettings:
 
     async def load(self) -> None:
         """Load settings from disk."""
-        loop = asyncio.get_running_loop()
-        await loop.run_in_executor(None, self._load)
+        self._loop = loop = asyncio.get_running_loop()
+        # A missing file is the common first-run case; a stat is cheap enough to do
+        # on the loop, so skip the executor hop for it
+        if self._settings_file is None or not self._settings_file.exists():
+            logger.debug("Settings file does not exist: %s", self._settings_file)
+            return
+        if await loop.run_in_executor(None, self._load):
+            # Treat the loaded state as saved, so reverting a change skips the write
+            self._last_serialized = _dumps(self.to_dict())
 
     async def flush(self) -> None:
         """Immediately save any pending changes to disk."""
+        # Let an in-flight write finish first, so this save can't be overtaken by it
+        if self._save_future is not None:
+            await self._save_future
         if self._debounce_save_handle is not None:
             self._debounce_save_handle.cancel()
             self._debounce_save_handle = None
-            loop = asyncio.get_running_loop()
-            await loop.run_in_executor(None, self._save)
+            if (payload := self._pending_payload()) is not None:
+                await self._submit_save(payload)
 
     def _schedule_save(self) -> None:
         """Schedule a debounced save operation."""
-        if self._debounce_save_handle is not None:
-            self._debounce_save_handle.cancel()
+        loop = self._get_loop()
+        # Push the deadline back; a pending timer re-arms itself when it fires early,
+        # so rapid changes don't cancel and reschedule a timer each time
+        self._save_deadline = loop.time() + SAVE_DEBOUNCE_SECONDS
+        if self._debounce_save_handle is None:
+            self._debounce_save_handle = loop.call_later(
+                SAVE_DEBOUNCE_SECONDS, self._debounced_save, loop
+            )
 
-        loop = asyncio.get_running_loop()
-        self._debounce_save_handle = loop.call_later(
-            SAVE_DEBOUNCE_SECONDS, self._debounced_save, loop
-        )
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        """Return the cached event loop, capturing the running one if load() was skipped."""
+        if self._loop is None:
+            self._loop = asyncio.get_running_loop()
+        return self._loop
 
     def _debounced_save(self, loop: asyncio.AbstractEventLoop) -> None:
-        """Called by the timer to save settings in executor."""
+        """Called by the timer to save settings in executor once the deadline has passed."""
+        remaining = self._save_deadline - loop.time()
+        if remaining > 0:
+            self._debounce_save_handle = loop.call_later(remaining, self._debounced_save, loop)
+            return
         self._debounce_save_handle = None
-        loop.run_in_executor(None, self._save)
+        if self._save_future is not None:
+            # The previous write is still in flight (slow storage); retry after another window
+            self._schedule_save()
+            return
+        if (payload := self._pending_payload()) is not None:
+            self._submit_save(payload)
+
+    def _load(self) -> bool:
+        """Load settings from the settings file (blocking I/O).
+
+        Fields missing from the file are reset to their defaults. Returns whether the
+        file was loaded.
+        """
+        if self._settings_file is None or not self._settings_file.exists():
+            logger.debug("Settings file does not exist: %s", self._settings_file)
+            return False
+
+        try:
+            data = _loads(self._settings_file.read_bytes())
+            for name, default, default_factory in _serialized_fields(type(self)):
+                if name in data:
+                    setattr(self, name, data[name])
+                elif default_factory is not None:
+                    setattr(self, name, default_factory())
+                else:
+                    setattr(self, name, default)
+            self._log_loaded()
+        except (json.JSONDecodeError, OSError) as e:
+            logger.warning("Failed to load settings from %s: %s", self._settings_file, e)
+            return False
+        return True
 
-    def _load(self) -> None:
-        """Load settings from the settings file (blocking I/O)."""
-        raise NotImplementedError
+    def _log_loaded(self) -> None:
+        """Log that settings were loaded."""
+        logger.info("Loaded settings from %s", self._settings_file)
 
-    def _save(self) -> None:
-        """Save settings to the settings file (blocking I/O)."""
+    def _pending_payload(self) -> bytes | None:
+        """Serialize settings on the event loop, or return None if there is nothing to write."""
         if self._settings_file is None:
-            return
+            return None
+        payload = _dumps(self.to_dict())
+        if payload == self._last_serialized:
+            logger.debug("Settings unchanged, skipping save to %s", self._settings_file)
+            return None
+        return payload
+
+    def _submit_save(self, payload: bytes) -> asyncio.Future[bool]:
+        """Write a payload in the executor, recording it as the last saved payload now."""
+        self._last_serialized = payload
+        future = self._get_loop().run_in_executor(None, self._save, payload)
+        self._save_future = future
+        future.add_done_callback(self._on_save_done)
+        return future
+
+    def _on_save_done(self, future: asyncio.Future[bool]) -> None:
+        """Clear the in-flight write and forget its payload if it was not written."""
+        if self._save_future is future:
+            self._save_future = None
+        if future.cancelled() or future.exception() is not None or not future.result():
+            # The file may not hold the submitted payload, so the next save must write
+            self._last_serialized = None
+
+    def _save(self, payload: bytes) -> bool:
+        """Save serialized settings to the settings file (blocking I/O).
+
+        Returns whether the file was written.
+        """
+        assert self._settings_file is not None
+        # Write to a temporary file and rename it over the settings file, so a crash
+        # mid-write never leaves a truncated settings file behind
+        tmp_file = self._settings_file.with_name(f"{self._settings_file.name}.tmp")
         try:
             self._settings_file.parent.mkdir(parents=True, exist_ok=True)
-            self._settings_file.write_text(json.dumps(self.to_dict(), indent=2) + "\n")
-            logger.debug("Saved settings to %s", self._settings_file)
+            with tmp_file.open("wb") as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+            tmp_file.replace(self._settings_file)
         except OSError as e:
             logger.warning("Failed to save settings to %s: %s", self._settings_file, e)
+            with contextlib.suppress(OSError):
+                tmp_file.unlink(missing_ok=True)
+            return False
+        logger.debug("Saved settings to %s", self._settings_file)
+        return True
+
+
+# (name, default, default_factory) of each serialized field
+_SerializedField = tuple[str, Any, Callable[[], Any] | None]
 
+# Serialized fields per settings class, filled on first use
+_SERIALIZED_FIELDS: dict[type[BaseSettings], tuple[_SerializedField, ...]] = {}
 
-@dataclass
+
+def _serialized_fields(cls: type[BaseSettings]) -> tuple[_SerializedField, ...]:
+    """Return (name, default, default_factory) for each field of a settings class saved to disk.
+
+    Raises:
+        TypeError: If a serialized field has neither a default nor a default_factory.
+    """
+    if (cached := _SERIALIZED_FIELDS.get(cls)) is not None:
+        return cached
+    serialized: list[_SerializedField] = []
+    for f in fields(cls):
+        if f.name in cls._internal_fields:
+            continue
+        if f.default_factory is not MISSING:
+            serialized.append((f.name, None, f.default_factory))
+        elif f.default is not MISSING:
+            serialized.append((f.name, f.default, None))
+        else:
+            raise TypeError(f"Settings field {cls.__name__}.{f.name} has no default")
+    _SERIALIZED_FIELDS[cls] = result = tuple(serialized)
+    return result
+
+
+@dataclass(slots=True)
 class ClientSettings(BaseSettings):
     """Settings for TUI and daemon modes."""
 
@@ -145,19 +306,19 @@ class ClientSettings(BaseSettings):
         # Handle other fields generically
         changed = (
             self._update_fields(
-                {
-                    "player_muted": player_muted,
-                    "static_delay_ms": static_delay_ms,
-                    "last_server_url": last_server_url,
-                    "name": name,
-                    "client_id": client_id,
-                    "audio_device": audio_device,
-                    "log_level": log_level,
-                    "listen_port": listen_port,
-                    "use_mpris": use_mpris,
-                    "hook_start": hook_start,
-                    "hook_stop": hook_stop,
-                }
+                (
+                    ("player_muted", player_muted),
+                    ("static_delay_ms", static_delay_ms),
+                    ("last_server_url", last_server_url),
+                    ("name", name),
+                    ("client_id", client_id),
+                    ("audio_device", audio_device),
+                    ("log_level", log_level),
+                    ("listen_port", listen_port),
+                    ("use_mpris", use_mpris),
+                    ("hook_start", hook_start),
+                    ("hook_stop", hook_stop),
+                )
             )
             or changed
         )
@@ -165,38 +326,17 @@ class ClientSettings(BaseSettings):
         if changed:
             self._schedule_save()
 
-    def _load(self) -> None:
-        """Load settings from the settings file (blocking I/O)."""
-        if self._settings_file is None or not self._settings_file.exists():
-            logger.debug("Settings file does not exist: %s", self._settings_file)
-            return
-
-        try:
-            data = json.loads(self._settings_file.read_text())
-            # Update fields from loaded data
-            self.name = data.get("name")
-            self.log_level = data.get("log_level")
-            self.listen_port = data.get("listen_port")
-            self.player_volume = data.get("player_volume", 25)
-            self.player_muted = data.get("player_muted", False)
-            self.static_delay_ms = data.get("static_delay_ms", 0.0)
-            self.last_server_url = data.get("last_server_url")
-            self.client_id = data.get("client_id")
-            self.audio_device = data.get("audio_device")
-            self.use_mpris = data.get("use_mpris", True)
-            self.hook_start = data.get("hook_start")
-            self.hook_stop = data.get("hook_stop")
-            logger.info(
-                "Loaded settings from %s: volume=%d%%, muted=%s",
-                self._settings_file,
-                self.player_volume,
-                self.player_muted,
-            )
-        except (json.JSONDecodeError, OSError) as e:
-            logger.warning("Failed to load settings from %s: %s", self._settings_file, e)
+    def _log_loaded(self) -> None:
+        """Log that settings were loaded, including the restored volume state."""
+        logger.info(
+            "Loaded settings from %s: volume=%d%%, muted=%s",
+            self._settings_file,
+            self.player_volume,
+            self.player_muted,
+        )
 
 
-@dataclass
+@dataclass(slots=True)
 class ServeSettings(BaseSettings):
     """Settings for serve mode."""
 
@@ -216,37 +356,19 @@ class ServeSettings(BaseSettings):
     ) -> None:
         """Update settings fields. Only changed fields trigger a save."""
         changed = self._update_fields(
-            {
-                "name": name,
-                "log_level": log_level,
-                "listen_port": listen_port,
-                "source": source,
-                "source_format": source_format,
-                "clients": clients,
-            }
+            (
+                ("name", name),
+                ("log_level", log_level),
+                ("listen_port", listen_port),
+                ("source", source),
+                ("source_format", source_format),
+                ("clients", clients),
+            )
         )
 
         if changed:
             self._schedule_save()
 
-    def _load(self) -> None:
-        """Load settings from the settings file (blocking I/O)."""
-        if self._settings_file is None or not self._settings_file.exists():
-            logger.debug("Settings file does not exist: %s", self._settings_file)
-            return
-
-        try:
-            data = json.loads(self._settings_file.read_text())
-            self.name = data.get("name")
-            self.log_level = data.get("log_level")
-            self.listen_port = data.get("listen_port")
-            self.source = data.get("source")
-            self.source_format = data.get("source_format")
-            self.clients = data.get("clients")
-            logger.info("Loaded settings from %s", self._settings_file)
-        except (json.JSONDecodeError, OSError) as e:
-            logger.warning("Failed to load settings from %s: %s", self._settings_file, e)
-
 
 async def get_client_settings(
     mode: Literal["tui", "daemon"], config_dir: str | None = None
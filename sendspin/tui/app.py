@@ -7,7 +7,7 @@ import contextlib
 import logging
 import signal
 import sys
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -21,13 +21,8 @@ from aiosendspin.models.core import (
     ServerCommandPayload,
     ServerStatePayload,
 )
-from aiosendspin.models.player import (
-    ClientHelloPlayerSupport,
-    PlayerCommandPayload,
-    SupportedAudioFormat,
-)
+from aiosendspin.models.player import PlayerCommandPayload
 from aiosendspin.models.types import (
-    AudioCodec,
     MediaCommand,
     PlaybackStateType,
     PlayerCommand,
@@ -43,7 +38,7 @@ from sendspin.hooks import run_hook
 from sendspin.settings import ClientSettings
 from sendspin.tui.keyboard import keyboard_loop
 from sendspin.tui.ui import SendspinUI
-from sendspin.utils import create_task, get_device_info
+from sendspin.utils import create_task, get_device_info, get_player_support
 
 logger = logging.getLogger(__name__)
 
@@ -52,13 +47,13 @@ class ServerSwitchRequested(Exception):
     """Raised when a connection attempt is cancelled due to server switch."""
 
 
-@dataclass
+@dataclass(slots=True)
 class AppState:
     """Holds state mirrored from the server for CLI presentation."""
 
     selected_server: DiscoveredServer | None = None
     playback_state: PlaybackStateType | None = None
-    supported_commands: set[MediaCommand] = field(default_factory=set)
+    supported_commands: frozenset[MediaCommand] = frozenset()
     volume: int | None = None
     muted: bool | None = None
     title: str | None = None
@@ -75,11 +70,18 @@ class AppState:
         changed = False
 
         # Update simple metadata fields
-        for attr in ("title", "artist", "album"):
-            value = getattr(metadata, attr)
-            if not isinstance(value, UndefinedField) and getattr(self, attr) != value:
-                setattr(self, attr, value)
-                changed = True
+        title = metadata.title
+        if not isinstance(title, UndefinedField) and self.title != title:
+            self.title = title
+            changed = True
+        artist = metadata.artist
+        if not isinstance(artist, UndefinedField) and self.artist != artist:
+            self.artist = artist
+            changed = True
+        album = metadata.album
+        if not isinstance(album, UndefinedField) and self.album != album:
+            self.album = album
+            changed = True
 
         # Update progress fields from nested progress object
         if isinstance(metadata.progress, UndefinedField):
@@ -116,10 +118,7 @@ class AppState:
             duration_s = self.track_duration / 1000
             lines.append(f"Progress: {progress_s:>5.1f} / {duration_s:>5.1f} s")
         if self.volume is not None:
-            vol_line = f"Volume: {self.volume}%"
-            if self.muted:
-                vol_line += " (muted)"
-            lines.append(vol_line)
+            lines.append(f"Volume: {self.volume}%{' (muted)' if self.muted else ''}")
         if self.playback_state is not None:
             lines.append(f"State: {self.playback_state.value}")
         return "\n".join(lines)
@@ -229,18 +228,7 @@ class SendspinApp:
             client_name=args.client_name,
             roles=[Roles.CONTROLLER, Roles.PLAYER, Roles.METADATA],
             device_info=get_device_info(),
-            player_support=ClientHelloPlayerSupport(
-                supported_formats=[
-                    SupportedAudioFormat(
-                        codec=AudioCodec.PCM, channels=2, sample_rate=44_100, bit_depth=16
-                    ),
-                    SupportedAudioFormat(
-                        codec=AudioCodec.PCM, channels=1, sample_rate=44_100, bit_depth=16
-                    ),
-                ],
-                buffer_capacity=32_000_000,
-                supported_commands=[PlayerCommand.VOLUME, PlayerCommand.MUTE],
-            ),
+            player_support=get_player_support(),
             static_delay_ms=0.0,  # Will be set after loading settings
         )
 
@@ -455,90 +443,100 @@ class SendspinApp:
         manager.set_last_attempted_url(url)
         skip_connect = already_connected
 
-        while True:
-            try:
-                if skip_connect:
-                    skip_connect = False
-                else:
-                    try:
-                        await self._connect_cancellable(url)
-                    except ServerSwitchRequested:
-                        # New server already set in state, update local url and retry
-                        url = self._state.selected_server.url
+        # A single event and listener serve every reconnect; the event is
+        # cleared before each attempt
+        disconnect_event = asyncio.Event()
+        unsubscribe = client.add_disconnect_listener(disconnect_event.set)
+
+        try:
+            while True:
+                try:
+                    if skip_connect:
+                        skip_connect = False
+                    else:
+                        # No-op while attached; re-attaches after a previous disconnect
+                        audio_handler.attach_client(client)
+                        disconnect_event.clear()
+                        try:
+                            await self._connect_cancellable(url)
+                        except ServerSwitchRequested:
+                            # New server already set in state, update local url and retry
+                            url = self._state.selected_server.url
+                            continue
+                        ui.add_event(f"Connected to {url}")
+                        ui.set_connected(url)
+                        manager.reset_backoff()
+                        manager.set_last_attempted_url(url)
+                        if self._settings:
+                            self._settings.update(last_server_url=url)
+
+                    # Wait for disconnect
+                    await disconnect_event.wait()
+
+                    # Connection dropped
+                    logger.info("Connection lost")
+                    ui.add_event("Connection lost")
+                    ui.set_disconnected("Connection lost")
+
+                    # Drop queued audio but keep the output stream open for the reconnect
+                    audio_handler.detach_client()
+
+                    # Check for pending URL from server selection first
+                    pending_server = manager.consume_pending_server()
+                    if pending_server:
+                        self._state.selected_server = pending_server
+                        url = pending_server.url
+                        manager.reset_backoff()
+                        ui.add_event(f"Switching to {url}...")
+                        ui.set_disconnected(f"Switching to {url}...")
                         continue
-                    ui.add_event(f"Connected to {url}")
-                    ui.set_connected(url)
-                    manager.reset_backoff()
-                    manager.set_last_attempted_url(url)
-                    if self._settings:
-                        self._settings.update(last_server_url=url)
-
-                # Wait for disconnect
-                disconnect_event: asyncio.Event = asyncio.Event()
-                unsubscribe = client.add_disconnect_listener(disconnect_event.set)
-                await disconnect_event.wait()
-                unsubscribe()
-
-                # Connection dropped
-                logger.info("Connection lost")
-                ui.add_event("Connection lost")
-                ui.set_disconnected("Connection lost")
-
-                # Clean up audio state
-                await audio_handler.cleanup()
-
-                # Check for pending URL from server selection first
-                pending_server = manager.consume_pending_server()
-                if pending_server:
-                    self._state.selected_server = pending_server
-                    url = pending_server.url
-                    manager.reset_backoff()
-                    ui.add_event(f"Switching to {url}...")
-                    ui.set_disconnected(f"Switching to {url}...")
-                    continue
-
-                # If URL was provided via --url, reconnect directly without mDNS
-                if self._args.url:
-                    ui.add_event(f"Reconnecting to {url}...")
-                    ui.set_disconnected(f"Reconnecting to {url}...")
-                    continue
 
-                # Update URL from discovery
-                server = servers[0] if (servers := discovery.get_servers()) else None
+                    # If URL was provided via --url, reconnect directly without mDNS
+                    if self._args.url:
+                        ui.add_event(f"Reconnecting to {url}...")
+                        ui.set_disconnected(f"Reconnecting to {url}...")
+                        continue
 
-                # Wait for server to reappear if it's gone
-                if not server:
-                    ui.set_disconnected("Waiting for server...")
-                    logger.info("Server offline, waiting for rediscovery...")
-                    ui.add_event("Waiting for server...")
+                    # Update URL from discovery
+                    server = servers[0] if (servers := discovery.get_servers()) else None
 
-                    server = await manager.discover_server()
+                    # Wait for server to reappear if it's gone
+                    if not server:
+                        ui.set_disconnected("Waiting for server...")
+                        logger.info("Server offline, waiting for rediscovery...")
+                        ui.add_event("Waiting for server...")
 
-                self._state.selected_server = server
-                url = server.url
-                ui.add_event(f"Reconnecting to {url}...")
-                ui.set_disconnected(f"Reconnecting to {url}...")
-
-            except (TimeoutError, OSError, ClientError) as e:
-                # Network-related errors - log cleanly
-                logger.debug(
-                    "Connection error (%s), retrying in %.0fs",
-                    type(e).__name__,
-                    manager.get_error_backoff(),
-                )
+                        server = await manager.discover_server()
 
-                await manager.handle_error_backoff(ui)
+                    self._state.selected_server = server
+                    url = server.url
+                    ui.add_event(f"Reconnecting to {url}...")
+                    ui.set_disconnected(f"Reconnecting to {url}...")
 
-                # Check if URL changed while sleeping
-                if servers := discovery.get_servers():
-                    current_url = servers[0].url
-                    new_url, _ = manager.update_backoff_and_url(current_url)
-                    if new_url:
-                        url = new_url
-            except Exception:
-                # Unexpected errors - log with full traceback
-                logger.exception("Unexpected error")
-                break
+                except (TimeoutError, OSError, ClientError) as e:
+                    # Network-related errors - log cleanly. The TUI runs at WARNING level
+                    # unless debugging, so skip building the arguments when disabled.
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(
+                            "Connection error (%s), retrying in %.0fs",
+                            type(e).__name__,
+                            manager.get_error_backoff(),
+                        )
+
+                    await manager.handle_error_backoff(ui)
+
+                    # Check if URL changed while sleeping
+                    if servers := discovery.get_servers():
+                        current_url = servers[0].url
+                        new_url, _ = manager.update_backoff_and_url(current_url)
+                        if new_url:
+                            url = new_url
+                except Exception:
+                    # Unexpected errors - log with full traceback
+                    logger.exception("Unexpected error")
+                    break
+        finally:
+            unsubscribe()
 
     def _show_server_selector(self) -> None:
         assert self._ui is not None
@@ -547,7 +545,7 @@ class SendspinApp:
         if self._state.selected_server:
             selected_host = self._state.selected_server.host
             if not any(s.host == selected_host for s in servers):
-                servers.insert(0, self._state.selected_server)
+                servers = (self._state.selected_server, *servers)
         self._ui.show_server_selector(servers)
 
     async def _on_server_selected(self) -> None:
@@ -576,40 +574,42 @@ class SendspinApp:
         assert self._ui is not None
         state = self._state
         ui = self._ui
-        if payload.metadata is not None and state.update_metadata(payload.metadata):
-            ui.set_metadata(
-                title=state.title,
-                artist=state.artist,
-                album=state.album,
-            )
-            ui.set_progress(state.track_progress, state.track_duration)
-            ui.add_event(state.describe())
+        with ui.batch():
+            if payload.metadata is not None and state.update_metadata(payload.metadata):
+                ui.set_metadata(
+                    title=state.title,
+                    artist=state.artist,
+                    album=state.album,
+                )
+                ui.set_progress(state.track_progress, state.track_duration)
+                ui.add_event(state.describe())
 
     def _handle_group_update(self, payload: GroupUpdateServerPayload) -> None:
         """Handle group update messages."""
         assert self._ui is not None
         state = self._state
         ui = self._ui
-        # Only clear metadata when actually switching to a different group
-        group_changed = payload.group_id is not None and payload.group_id != state.group_id
-        if group_changed:
-            state.group_id = payload.group_id
-            state.title = None
-            state.artist = None
-            state.album = None
-            state.track_progress = None
-            state.track_duration = None
-            ui.set_metadata(title=None, artist=None, album=None)
-            ui.clear_progress()
-            ui.add_event(f"Group ID: {payload.group_id}")
-
-        if payload.group_name:
-            ui.add_event(f"Group name: {payload.group_name}")
-        ui.set_group_name(payload.group_name)
-        if payload.playback_state:
-            state.playback_state = payload.playback_state
-            ui.set_playback_state(payload.playback_state)
-            ui.add_event(f"Playback state: {payload.playback_state.value}")
+        with ui.batch():
+            # Only clear metadata when actually switching to a different group
+            group_changed = payload.group_id is not None and payload.group_id != state.group_id
+            if group_changed:
+                state.group_id = payload.group_id
+                state.title = None
+                state.artist = None
+                state.album = None
+                state.track_progress = None
+                state.track_duration = None
+                ui.set_metadata(title=None, artist=None, album=None)
+                ui.clear_progress()
+                ui.add_event(f"Group ID: {payload.group_id}")
+
+            if payload.group_name:
+                ui.add_event(f"Group name: {payload.group_name}")
+            ui.set_group_name(payload.group_name)
+            if payload.playback_state:
+                state.playback_state = payload.playback_state
+                ui.set_playback_state(payload.playback_state)
+                ui.add_event(f"Playback state: {payload.playback_state.value}")
 
     def _handle_server_state(self, payload: ServerStatePayload) -> None:
         """Handle server/state messages with controller state."""
@@ -618,7 +618,9 @@ class SendspinApp:
         ui = self._ui
         if payload.controller:
             controller = payload.controller
-            state.supported_commands = set(controller.supported_commands)
+            supported_commands = frozenset(controller.supported_commands)
+            if supported_commands != state.supported_commands:
+                state.supported_commands = supported_commands
 
             volume_changed = controller.volume != state.volume
             mute_changed = controller.muted != state.muted
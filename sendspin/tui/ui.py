@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 import time
-from dataclasses import dataclass, field
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from dataclasses import dataclass
 from typing import Self
 
 from aiosendspin.models.types import PlaybackStateType
@@ -43,7 +45,7 @@ class UIState:
 
     # Server selector
     show_server_selector: bool = False
-    available_servers: list[DiscoveredServer] = field(default_factory=list)
+    available_servers: Sequence[DiscoveredServer] = ()
     selected_server_index: int = 0
 
     # Playback
@@ -89,6 +91,8 @@ class SendspinUI:
         )
         self._live: Live | None = None
         self._running = False
+        self._batch_depth = 0
+        self._refresh_pending = False
 
     @property
     def state(self) -> UIState:
@@ -413,10 +417,24 @@ class SendspinUI:
         """Add an event (no-op, events panel removed)."""
 
     def refresh(self) -> None:
-        """Request a UI refresh."""
-        if self._live is not None:
+        """Request a UI refresh, deferred until the outermost batch() exits."""
+        if self._batch_depth:
+            self._refresh_pending = True
+        elif self._live is not None:
             self._live.refresh()
 
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Coalesce refreshes requested inside the block into a single redraw."""
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and self._refresh_pending:
+                self._refresh_pending = False
+                self.refresh()
+
     def set_connected(self, url: str) -> None:
         """Update connection status to connected."""
         self._state.connected = True
@@ -498,7 +516,7 @@ class SendspinUI:
         self._state.delay_ms = delay_ms
         self.refresh()
 
-    def show_server_selector(self, servers: list[DiscoveredServer]) -> None:
+    def show_server_selector(self, servers: Sequence[DiscoveredServer]) -> None:
         """Show the server selector with available servers."""
         self._state.available_servers = servers
         self._state.selected_server_index = 0
@@ -3,22 +3,49 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import platform
-import sys
 from collections.abc import Coroutine
 from importlib.metadata import version
 from pathlib import Path
 from typing import Any, TypeVar
 
 from aiosendspin.models.core import DeviceInfo
+from aiosendspin.models.player import ClientHelloPlayerSupport, SupportedAudioFormat
+from aiosendspin.models.types import AudioCodec, PlayerCommand
 
 _T = TypeVar("_T")
 
-# Check if eager_start is supported (Python 3.12+)
-_SUPPORTS_EAGER_START = sys.version_info >= (3, 12)
-
 TASKS: set[asyncio.Task[Any]] = set()
 
+# Audio formats accepted by the player (stereo and mono 16-bit PCM)
+SUPPORTED_FORMATS: tuple[SupportedAudioFormat, ...] = (
+    SupportedAudioFormat(codec=AudioCodec.PCM, channels=2, sample_rate=44_100, bit_depth=16),
+    SupportedAudioFormat(codec=AudioCodec.PCM, channels=1, sample_rate=44_100, bit_depth=16),
+)
+
+# Player capabilities are static, so every client shares a single instance
+_PLAYER_SUPPORT = ClientHelloPlayerSupport(
+    supported_formats=list(SUPPORTED_FORMATS),
+    buffer_capacity=32_000_000,
+    supported_commands=[PlayerCommand.VOLUME, PlayerCommand.MUTE],
+)
+
+
+def _retrieve_exception(task: asyncio.Task[Any]) -> None:
+    """Mark a finished task's exception as retrieved to avoid "never retrieved" warnings."""
+    if not task.cancelled():
+        task.exception()
+
+
+def _track_task(task: asyncio.Task[_T]) -> asyncio.Task[_T]:
+    """Keep a strong reference to a pending task until it finishes."""
+    if not task.done():
+        TASKS.add(task)
+        task.add_done_callback(TASKS.discard)
+        task.add_done_callback(_retrieve_exception)
+    return task
+
 
 def create_task(
     coro: Coroutine[None, None, _T],
@@ -31,42 +58,31 @@ def create_task(
 
     This wrapper ensures tasks begin executing immediately rather than
     waiting for the next event loop iteration, improving performance
-    and reducing latency (when supported by the Python version).
-
-    Note: eager_start is only supported in Python 3.12+. On older versions,
-    this parameter is ignored and tasks behave normally.
+    and reducing latency.
 
     Args:
         coro: The coroutine to run as a task.
         loop: Optional event loop to use. If None, uses the running loop.
         name: Optional name for the task (for debugging).
         eager_start: Whether to start the task eagerly (default: True).
-                     Only used if Python version supports it.
 
     Returns:
         The created asyncio Task.
     """
     if loop is None:
         loop = asyncio.get_running_loop()
-
-    if _SUPPORTS_EAGER_START and eager_start:
+    if eager_start:
         # Use Task constructor directly - it supports eager_start and schedules automatically
-        task = asyncio.Task(coro, loop=loop, name=name, eager_start=True)
-    else:
-        task = loop.create_task(coro, name=name)
-
-    if task.done():
-        return task
-
-    TASKS.add(task)
-    task.add_done_callback(TASKS.discard)
-    task.add_done_callback(lambda t: t.exception() if not t.cancelled() else None)
-
-    return task
+        return _track_task(asyncio.Task(coro, loop=loop, name=name, eager_start=True))
+    return _track_task(loop.create_task(coro, name=name))
 
 
+@functools.cache
 def get_device_info() -> DeviceInfo:
-    """Get device information for the client hello message."""
+    """Get device information for the client hello message.
+
+    The result is static for the process, so it is computed once and cached.
+    """
     # Get OS/platform information
     system = platform.system()
     product_name = f"{system}"
@@ -109,3 +125,8 @@ def get_device_info() -> DeviceInfo:
         manufacturer=None,  # Could add manufacturer detection if needed
         software_version=software_version,
     )
+
+
+def get_player_support() -> ClientHelloPlayerSupport:
+    """Get the player capabilities for the client hello message."""
+    return _PLAYER_SUPPORT